@@ -1,74 +1,106 @@
-from pydantic import BaseModel
-from typing import List, Dict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple
 import os
 
-class FrameExtractionSettings(BaseModel):
+# Backend root directory (the parent of the app package)
+BASE_DIR = Path(__file__).resolve().parents[2]
+
+@dataclass(frozen=True)
+class FrameExtractionSettings:
     """Frame extraction configuration settings."""
     # Directory name for storing extracted frames
     FRAMES_DIR: str = "frames"
-    
+
     # Maximum number of frames to extract per video
     MAX_FRAMES: int = 100
-    
+
     # Available frame rates for UI selection
-    AVAILABLE_FRAME_RATES: List[int] = [1, 2, 5, 10, 15, 24, 30]
-    
+    AVAILABLE_FRAME_RATES: List[int] = field(default_factory=lambda: [1, 2, 5, 10, 15, 24, 30])
+
     # Default frame rate (sample every Nth frame)
     DEFAULT_SAMPLE_RATE: int = 24
-    
+
     # Minimum quality score for a frame to be considered
     MIN_QUALITY_SCORE: float = 30.0
-    
+
     # Whether to use parallel processing
     USE_PARALLEL: bool = True
-    
+
     # Maximum number of worker processes (None = auto-detect)
-    MAX_WORKERS: int = None
-    
+    MAX_WORKERS: Optional[int] = None
+
+    # Maximum number of videos extracted concurrently
+    MAX_CONCURRENT_EXTRACTIONS: int = 2
+
+    # How many extraction requests may wait for a slot before new
+    # requests are rejected with 503
+    EXTRACT_BACKLOG: int = 8
+
     # Thumbnail size for preview (width, height)
-    THUMBNAIL_SIZE: List[int] = [320, 180]
-    
+    THUMBNAIL_SIZE: List[int] = field(default_factory=lambda: [320, 180])
+
     # JPEG quality for thumbnails (1-100)
     THUMBNAIL_QUALITY: int = 85
-    
+
     # Maximum frames to display in UI at once
     UI_MAX_DISPLAY_FRAMES: int = 50
 
-class Settings(BaseModel):
+# Shared default instance — every Settings construction reuses it instead
+# of building a fresh nested settings object
+@lru_cache(maxsize=1)
+def _frame_extraction_settings() -> FrameExtractionSettings:
+    return FrameExtractionSettings()
+
+@dataclass(frozen=True)
+class Settings:
     """Application settings."""
     # API configuration
     API_V1_STR: str = "/api"
     PROJECT_NAME: str = "ClipCraft"
-    
+
     # CORS settings
-    CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:8080"]
-    
+    CORS_ORIGINS: Tuple[str, ...] = ("http://localhost:3000", "http://localhost:8080")
+
     # File storage
     UPLOAD_DIR: str = "uploads"
     RESULTS_DIR: str = "results"
-    
+
     # Maximum upload size (10GB)
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024 * 1024  # 10GB in bytes
-    
+
     # Frame extraction settings
-    FRAME_EXTRACTION: FrameExtractionSettings = FrameExtractionSettings()
+    FRAME_EXTRACTION: FrameExtractionSettings = field(default_factory=_frame_extraction_settings)
+
+# The settings instance is built lazily on first access (PEP 562) so
+# importing this module stays cheap
+_settings: Optional[Settings] = None
+
+def _get_settings() -> Settings:
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
+
+def __getattr__(name: str):
+    if name == "settings":
+        return _get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Create required directories if they don't exist
 def create_directories():
-    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-    
+    s = _get_settings()
     dirs = [
-        os.path.join(base_dir, Settings().UPLOAD_DIR),
-        os.path.join(base_dir, Settings().UPLOAD_DIR, "videos"),
-        os.path.join(base_dir, Settings().RESULTS_DIR),
-        os.path.join(base_dir, Settings().RESULTS_DIR, Settings().FRAME_EXTRACTION.FRAMES_DIR)
+        BASE_DIR / s.UPLOAD_DIR,
+        BASE_DIR / s.UPLOAD_DIR / "videos",
+        BASE_DIR / s.RESULTS_DIR,
+        BASE_DIR / s.RESULTS_DIR / s.FRAME_EXTRACTION.FRAMES_DIR
     ]
-    
+
     for directory in dirs:
         os.makedirs(directory, exist_ok=True)
         print(f"Created directory: {directory}")
 
 # Create directories on import
-create_directories()
-
-settings = Settings() 
\ No newline at end of file
+create_directories()
\ No newline at end of file
@@ -3,10 +3,10 @@ Custom error handlers for the application.
 """
 
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 import logging
-from typing import Dict, Any, Optional, List, Type
+from typing import Dict, Any, Optional, List
 from pydantic import ValidationError
 
 logger = logging.getLogger(__name__)
@@ -60,16 +60,11 @@ class ProcessingError(FrameExtractionError):
             details=error_details
         )
 
-def register_exception_handlers(app: FastAPI) -> None:
-    """Register exception handlers for the application."""
-    
-    @app.exception_handler(FrameExtractionError)
-    async def frame_extraction_exception_handler(
-        request: Request, exc: FrameExtractionError
-    ) -> JSONResponse:
-        """Handle FrameExtractionError exceptions."""
-        logger.error(f"FrameExtractionError: {exc.message}")
-        return JSONResponse(
+async def handle_exception(request: Request, exc: Exception) -> ORJSONResponse:
+    """Handle all application exceptions, dispatching on exception type."""
+    if isinstance(exc, FrameExtractionError):
+        logger.error("FrameExtractionError: %s", exc.message)
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={
                 "error": True,
@@ -78,22 +73,18 @@ def register_exception_handlers(app: FastAPI) -> None:
                 "status_code": exc.status_code
             }
         )
-    
-    @app.exception_handler(RequestValidationError)
-    async def validation_exception_handler(
-        request: Request, exc: RequestValidationError
-    ) -> JSONResponse:
-        """Handle validation errors."""
-        error_details = []
-        for error in exc.errors():
-            loc = " -> ".join([str(l) for l in error.get("loc", [])])
-            error_details.append({
-                "location": loc,
+
+    if isinstance(exc, RequestValidationError):
+        error_details = [
+            {
+                "location": " -> ".join(map(str, error.get("loc", ()))),
                 "message": error.get("msg", "Validation error"),
                 "type": error.get("type", "")
-            })
-        
-        return JSONResponse(
+            }
+            for error in exc.errors()
+        ]
+
+        return ORJSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content={
                 "error": True,
@@ -102,32 +93,41 @@ def register_exception_handlers(app: FastAPI) -> None:
                 "status_code": status.HTTP_422_UNPROCESSABLE_ENTITY
             }
         )
-    
-    @app.exception_handler(ValidationError)
-    async def pydantic_validation_exception_handler(
-        request: Request, exc: ValidationError
-    ) -> JSONResponse:
-        """Handle Pydantic validation errors."""
-        return JSONResponse(
+
+    if isinstance(exc, ValidationError):
+        # Skip documentation-URL/context/input formatting — only the error
+        # locations and messages are returned to the client
+        errors = exc.errors(include_url=False, include_context=False, include_input=False)
+        return ORJSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content={
                 "error": True,
                 "message": "Data validation error",
-                "details": exc.errors(),
+                "details": errors,
                 "status_code": status.HTTP_422_UNPROCESSABLE_ENTITY
             }
         )
-    
-    @app.exception_handler(Exception)
-    async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-        """Handle any unhandled exceptions."""
-        logger.exception(f"Unhandled exception: {str(exc)}")
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "error": True,
-                "message": "An unexpected error occurred",
-                "details": {"error": str(exc)},
-                "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR
-            }
-        ) 
\ No newline at end of file
+
+    logger.exception("Unhandled exception: %s", exc)
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={
+            "error": True,
+            "message": "An unexpected error occurred",
+            "details": {"error": str(exc)},
+            "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR
+        }
+    )
+
+# Exception classes routed through handle_exception
+_HANDLED_EXCEPTIONS = (
+    FrameExtractionError,
+    RequestValidationError,
+    ValidationError,
+    Exception,
+)
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """Register exception handlers for the application."""
+    for exc_class in _HANDLED_EXCEPTIONS:
+        app.add_exception_handler(exc_class, handle_exception) 
\ No newline at end of file
@@ -1,10 +1,16 @@
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
+from contextlib import asynccontextmanager
+import asyncio
+import importlib.util
 import os
+import stat
 import logging
+import orjson
 
-from app.core.config import settings
+from app.core.config import BASE_DIR, settings
 from app.core.error_handlers import register_exception_handlers
 from app.routers import health, videos, frames
 
@@ -15,11 +21,43 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info("%s API starting up...", settings.PROJECT_NAME)
+    logger.info("Maximum upload size: %.1f GB", settings.MAX_UPLOAD_SIZE / (1024 * 1024 * 1024))
+    logger.info("Frame extraction enabled with sample rates: %s", settings.FRAME_EXTRACTION.AVAILABLE_FRAME_RATES)
+
+    # Directory audit does real IO on every boot; opt in when debugging.
+    # The two parent directories are audited concurrently in the thread
+    # pool so slow filesystems don't serialize the stat calls.
+    if os.environ.get("CLIPCRAFT_STARTUP_AUDIT") == "1":
+        logger.info("Upload directory: %s", upload_dir)
+        logger.info("Videos directory: %s", os.path.join(upload_dir, 'videos'))
+        logger.info("Results directory: %s", results_dir)
+        logger.info("Frames directory: %s", os.path.join(results_dir, 'frames'))
+        await asyncio.gather(
+            asyncio.to_thread(audit_directory, upload_dir, "videos"),
+            asyncio.to_thread(audit_directory, results_dir, "frames"),
+        )
+
+    # Check if frame_analyzer is available without importing it (the real
+    # import happens lazily on the first frame extraction request)
+    if importlib.util.find_spec("app.services.frame_extraction.analyzer") is not None:
+        logger.info("Frame analyzer is available")
+    else:
+        logger.error("Frame analyzer module not found")
+
+    yield
+
+    logger.info("%s API shutting down...", settings.PROJECT_NAME)
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url=f"{settings.API_V1_STR}/docs",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Register exception handlers
@@ -30,8 +68,8 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization"],
 )
 
 # Include routers
@@ -40,61 +78,60 @@ app.include_router(videos.router, prefix=f"{settings.API_V1_STR}/videos", tags=[
 app.include_router(frames.router, prefix=f"{settings.API_V1_STR}/frames", tags=["frames"])
 
 # Mount static file directories for uploads and results
-upload_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), settings.UPLOAD_DIR)
-results_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), settings.RESULTS_DIR)
+# (the directories themselves are created by config.create_directories)
+upload_dir = str(BASE_DIR / settings.UPLOAD_DIR)
+results_dir = str(BASE_DIR / settings.RESULTS_DIR)
 
-# Create directories if they don't exist
-os.makedirs(upload_dir, exist_ok=True)
-os.makedirs(results_dir, exist_ok=True)
+if os.environ.get("CLIPCRAFT_X_ACCEL") == "1":
+    # Delegate file serving to a reverse proxy (nginx internal locations
+    # /internal/uploads and /internal/results) instead of streaming large
+    # files through Python workers
+    @app.get("/uploads/{path:path}", include_in_schema=False)
+    async def serve_upload(path: str):
+        return Response(headers={"X-Accel-Redirect": f"/internal/uploads/{path}"})
 
-# Create subdirectories
-videos_dir = os.path.join(upload_dir, "videos")
-frames_dir = os.path.join(results_dir, "frames")
-os.makedirs(videos_dir, exist_ok=True)
-os.makedirs(frames_dir, exist_ok=True)
+    @app.get("/results/{path:path}", include_in_schema=False)
+    async def serve_result(path: str):
+        return Response(headers={"X-Accel-Redirect": f"/internal/results/{path}"})
+else:
+    app.mount("/uploads", StaticFiles(directory=upload_dir), name="uploads")
+    app.mount("/results", StaticFiles(directory=results_dir), name="results")
 
-app.mount("/uploads", StaticFiles(directory=upload_dir), name="uploads")
-app.mount("/results", StaticFiles(directory=results_dir), name="results")
+def audit_directory(parent: str, child: str):
+    """Log existence and writability of a parent directory and one child.
 
-# Root endpoint
-@app.get("/")
-async def root():
-    return {
-        "message": f"Welcome to {settings.PROJECT_NAME} API",
-        "docs": f"{settings.API_V1_STR}/docs",
-    }
-
-@app.on_event("startup")
-async def startup_event():
-    logger.info(f"{settings.PROJECT_NAME} API starting up...")
-    logger.info(f"Maximum upload size: {settings.MAX_UPLOAD_SIZE / (1024 * 1024 * 1024):.1f} GB")
-    logger.info(f"Frame extraction enabled with sample rates: {settings.FRAME_EXTRACTION.AVAILABLE_FRAME_RATES}")
-    
-    # Log directory paths for debugging
-    logger.info(f"Upload directory: {upload_dir}")
-    logger.info(f"Videos directory: {os.path.join(upload_dir, 'videos')}")
-    logger.info(f"Results directory: {results_dir}")
-    logger.info(f"Frames directory: {os.path.join(results_dir, 'frames')}")
-    
-    # Check directory existence and permissions
-    for dir_path in [upload_dir, os.path.join(upload_dir, 'videos'), 
-                     results_dir, os.path.join(results_dir, 'frames')]:
-        if os.path.exists(dir_path):
-            logger.info(f"Directory exists: {dir_path}")
-            if os.access(dir_path, os.W_OK):
-                logger.info(f"Directory is writable: {dir_path}")
-            else:
-                logger.warning(f"Directory is not writable: {dir_path}")
+    The parent is scanned once with os.scandir so the expected child
+    directory is checked from the cached DirEntry stat instead of issuing
+    separate exists/access syscalls per path.
+    """
+    def log_status(path, st):
+        if st.st_mode & stat.S_IWUSR:
+            logger.info("Directory is writable: %s", path)
         else:
-            logger.warning(f"Directory does not exist: {dir_path}")
-    
-    # Check if frame_analyzer is available
+            logger.warning("Directory is not writable: %s", path)
+
     try:
-        from app.services.frame_extraction.analyzer import FrameAnalyzer
-        logger.info("Frame analyzer is available")
-    except ImportError as e:
-        logger.error(f"Failed to import frame analyzer: {e}")
+        with os.scandir(parent) as entries:
+            children = {e.name: e for e in entries}
+    except FileNotFoundError:
+        logger.warning("Directory does not exist: %s", parent)
+        return
+
+    log_status(parent, os.stat(parent))
+
+    child_entry = children.get(child)
+    if child_entry is not None and child_entry.is_dir():
+        log_status(child_entry.path, child_entry.stat())
+    else:
+        logger.warning("Directory does not exist: %s", os.path.join(parent, child))
+
+# Root endpoint — the body never changes, so serialize it once at import
+_ROOT_BODY = orjson.dumps({
+    "message": f"Welcome to {settings.PROJECT_NAME} API",
+    "docs": f"{settings.API_V1_STR}/docs",
+})
+
+@app.get("/")
+async def root():
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    logger.info(f"{settings.PROJECT_NAME} API shutting down...") 
\ No newline at end of file
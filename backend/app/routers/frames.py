@@ -2,19 +2,22 @@
 Router for frame extraction endpoints.
 """
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks, Depends, Path, Query, Request
+from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks, Depends, Path, Query, Request, Response
 from fastapi.responses import JSONResponse
+from functools import lru_cache
 from typing import Dict, List, Optional
+import asyncio
 import logging
 import os
+import struct
 import uuid
 from datetime import datetime
 from pathlib import Path as PathLib
-import json
+import orjson
 
 from app.core.config import settings
 from app.core.error_handlers import VideoNotFoundError, FrameNotFoundError, ProcessingError
-from app.services.frame_extraction.analyzer import FrameAnalyzer
+from app.services import task_store
 from app.services.frame_extraction.utils import get_video_info, get_frame_output_dir
 from app.services.frame_extraction.metadata import (
     save_frame_metadata,
@@ -37,54 +40,65 @@ from app.services.frame_extraction.schemas import (
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# Map of task_ids to task information
-active_tasks = {}
-
-# Debug endpoint to check metadata files
+# Debug endpoint to check metadata and uploaded files for a video
 @router.get("/debug/{video_id}", response_model=Dict)
 async def debug_metadata(video_id: str):
     """
-    Debug endpoint to check if metadata files exist for a given video_id.
-    
+    Debug endpoint reporting everything known about a video_id: its frame
+    output directory, metadata file, and any matching uploaded video files.
+
     Args:
         video_id: ID of the video to check
-        
+
     Returns:
-        Debug information about the metadata files
+        Debug information about the metadata and video files
     """
     try:
         # Get the frame output directory
         output_dir = get_frame_output_dir(video_id)
         metadata_path = output_dir / "metadata.json"
-        
-        # Check if the directory exists
-        dir_exists = os.path.isdir(output_dir)
-        
-        # Check if the metadata file exists
-        metadata_exists = os.path.isfile(metadata_path)
-        
+
+        # One scandir of the output directory covers the existence checks
+        # and the file listing in a single directory read
+        try:
+            with os.scandir(output_dir) as entries:
+                files_in_dir = [e.name for e in entries]
+            dir_exists = True
+        except (FileNotFoundError, NotADirectoryError):
+            files_in_dir = []
+            dir_exists = False
+
+        metadata_exists = "metadata.json" in files_in_dir
+
         # Try to load the metadata if it exists
         metadata_content = None
         if metadata_exists:
             try:
-                with open(metadata_path, 'r') as f:
-                    metadata_content = json.load(f)
+                with open(metadata_path, 'rb') as f:
+                    metadata_content = orjson.loads(f.read())
             except Exception as e:
                 metadata_content = f"Error reading metadata: {str(e)}"
-        
-        # List all files in the directory
-        files_in_dir = []
-        if dir_exists:
-            files_in_dir = os.listdir(output_dir)
-        
-        # Get the base frames directory
+
+        # Get the base frames directory and list all video directories
         base_frames_dir = PathLib(settings.RESULTS_DIR) / settings.FRAME_EXTRACTION.FRAMES_DIR
-        
-        # List all video directories
-        all_video_dirs = []
-        if os.path.isdir(base_frames_dir):
-            all_video_dirs = os.listdir(base_frames_dir)
-        
+        try:
+            with os.scandir(base_frames_dir) as entries:
+                all_video_dirs = [e.name for e in entries]
+        except (FileNotFoundError, NotADirectoryError):
+            all_video_dirs = []
+
+        # Look for uploaded video files matching this ID
+        video_dir = PathLib(settings.UPLOAD_DIR) / "videos"
+        video_files_found = []
+        try:
+            with os.scandir(video_dir) as entries:
+                video_files_found = [
+                    e.path for e in entries
+                    if e.name.startswith(video_id + '.')
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+
         return {
             "video_id": video_id,
             "directory_path": str(output_dir),
@@ -94,7 +108,10 @@ async def debug_metadata(video_id: str):
             "files_in_directory": files_in_dir,
             "frames_base_dir": str(base_frames_dir),
             "all_video_dirs": all_video_dirs,
-            "metadata_content": metadata_content
+            "metadata_content": metadata_content,
+            "upload_dir": str(video_dir),
+            "video_files_found": video_files_found,
+            "video_files_exist": len(video_files_found) > 0
         }
     except Exception as e:
         logger.error(f"Error in debug endpoint: {e}")
@@ -103,77 +120,154 @@ async def debug_metadata(video_id: str):
             "video_id": video_id
         }
 
+# Absolute directory prefixes, computed once — os.path.abspath does a
+# getcwd call per invocation, so keep it out of the per-frame path
+_RESULTS_DIR_ABS = os.path.abspath(settings.RESULTS_DIR)
+_UPLOADS_DIR_ABS = os.path.abspath(settings.UPLOAD_DIR)
+_RESULTS_PREFIX = _RESULTS_DIR_ABS.replace(os.sep, '/') + '/'
+_UPLOADS_PREFIX = _UPLOADS_DIR_ABS.replace(os.sep, '/') + '/'
+
+# Relative paths that already use the public URL prefixes; a tuple
+# argument lets a single startswith call test both
+_REL_PREFIXES = ("results/", "uploads/")
+
 def convert_path_to_url(request: Request, file_path: str) -> str:
     """
     Convert a file path to a URL that can be accessed by the frontend.
-    
+
     Args:
         request: The FastAPI request object
         file_path: The file path to convert
-        
+
     Returns:
         URL that can be accessed by the frontend
     """
     if not file_path:
         return None
-        
-    # Get the base URL from the request
-    base_url = str(request.base_url).rstrip('/')
-    
-    # Handle relative paths that start with "results/" or "uploads/"
-    if file_path.startswith("results/"):
-        return f"{base_url}/{file_path}"
-    
-    if file_path.startswith("uploads/"):
-        return f"{base_url}/{file_path}"
-    
-    # Convert the file path to a URL for absolute paths
-    path = PathLib(file_path)
-    
-    # Check if the path is in the results directory
-    results_dir = PathLib(os.path.abspath(settings.RESULTS_DIR))
-    if str(results_dir) in str(path) or settings.RESULTS_DIR in str(path):
-        # Extract the part of the path after "results"
-        if settings.RESULTS_DIR in str(path):
-            parts = str(path).split(settings.RESULTS_DIR)
-            if len(parts) > 1:
-                return f"{base_url}/results{parts[1].replace(os.sep, '/')}"
-        else:
-            parts = str(path).split(results_dir.name)
-            if len(parts) > 1:
-                return f"{base_url}/results{parts[1].replace(os.sep, '/')}"
-    
-    # Check if the path is in the uploads directory
-    uploads_dir = PathLib(os.path.abspath(settings.UPLOAD_DIR))
-    if str(uploads_dir) in str(path) or settings.UPLOAD_DIR in str(path):
-        # Extract the part of the path after "uploads"
-        if settings.UPLOAD_DIR in str(path):
-            parts = str(path).split(settings.UPLOAD_DIR)
-            if len(parts) > 1:
-                return f"{base_url}/uploads{parts[1].replace(os.sep, '/')}"
-        else:
-            parts = str(path).split(uploads_dir.name)
-            if len(parts) > 1:
-                return f"{base_url}/uploads{parts[1].replace(os.sep, '/')}"
-    
+
+    return _convert_path_to_url_cached(str(request.base_url).rstrip('/'), file_path)
+
+@lru_cache(maxsize=16384)
+def _convert_path_to_url_cached(base_url: str, file_path: str) -> str:
+    """Pure path-to-URL conversion, memoized on (base_url, file_path)."""
+    # Normalize separators once (no-op allocation-free check on POSIX)
+    path = file_path.replace(os.sep, '/') if os.sep != '/' else file_path
+
+    # Relative paths that already use the public prefixes
+    if path.startswith(_REL_PREFIXES):
+        return f"{base_url}/{path}"
+
+    # Absolute paths inside the results/uploads directories
+    if path.startswith(_RESULTS_PREFIX):
+        return f"{base_url}/results/{path[len(_RESULTS_PREFIX):]}"
+
+    if path.startswith(_UPLOADS_PREFIX):
+        return f"{base_url}/uploads/{path[len(_UPLOADS_PREFIX):]}"
+
+    return _convert_path_to_url_slow(base_url, path)
+
+def _convert_path_to_url_slow(base_url: str, path: str) -> str:
+    """Cold path for paths outside the known directory prefixes."""
+    # Paths nested under some other root but containing the results or
+    # uploads directory name
+    marker = f"/{settings.RESULTS_DIR}/"
+    idx = path.find(marker)
+    if idx != -1:
+        return f"{base_url}/results/{path[idx + len(marker):]}"
+
+    marker = f"/{settings.UPLOAD_DIR}/"
+    idx = path.find(marker)
+    if idx != -1:
+        return f"{base_url}/uploads/{path[idx + len(marker):]}"
+
     # If we can't determine the URL, log a warning and return a fallback URL
-    logger.warning(f"Could not convert path to URL: {file_path}")
-    
+    logger.warning(f"Could not convert path to URL: {path}")
+
     # Try to extract the filename and create a URL based on the video_id if available
-    filename = os.path.basename(file_path)
-    if "thumbnails" in file_path:
+    filename = os.path.basename(path)
+    if "thumbnails" in path:
         # This is likely a thumbnail
-        video_id = file_path.split(os.sep)[-3] if os.sep in file_path else None
+        video_id = path.split('/')[-3] if '/' in path else None
         if video_id and len(video_id) > 30:  # Likely a UUID
             return f"{base_url}/results/frames/{video_id}/thumbnails/{filename}"
     else:
         # This is likely a full frame
-        video_id = file_path.split(os.sep)[-2] if os.sep in file_path else None
+        video_id = path.split('/')[-2] if '/' in path else None
         if video_id and len(video_id) > 30:  # Likely a UUID
             return f"{base_url}/results/frames/{video_id}/{filename}"
-    
+
     # Last resort: return the original path
-    return file_path
+    return path
+
+def _read_jpeg_dims(path: str) -> tuple:
+    """
+    Read JPEG dimensions from the SOF header without decoding the image.
+
+    Walks the JPEG segment markers in the first 64 KiB of the file and
+    unpacks width/height from the start-of-frame segment, so listing
+    legacy frames costs a small header read instead of a full decode.
+
+    Returns:
+        (width, height), falling back to (1280, 720) if parsing fails
+    """
+    try:
+        with open(path, 'rb') as f:
+            buf = f.read(65536)
+
+        i = 2  # Skip the SOI marker
+        while i + 9 < len(buf):
+            if buf[i] != 0xFF:
+                i += 1
+                continue
+            marker = buf[i + 1]
+            if marker in (0xC0, 0xC1, 0xC2, 0xC3):  # SOF segments
+                height, width = struct.unpack('>HH', buf[i + 5:i + 9])
+                return width, height
+            if marker == 0xFF:  # Fill byte
+                i += 1
+            elif 0xD0 <= marker <= 0xD9:  # RST/SOI/EOI have no length field
+                i += 2
+            else:
+                i += 2 + struct.unpack('>H', buf[i + 2:i + 4])[0]
+    except Exception as e:
+        logger.warning(f"Could not read JPEG header for {path}: {e}")
+
+    return 1280, 720  # Fallback dimensions
+
+def _find_video_file(video_dir: PathLib, video_id: str) -> Optional[PathLib]:
+    """
+    Locate the video file for an ID with a single directory scan.
+
+    Checks, in order of preference: an exact "{video_id}.*" match (returned
+    immediately), any filename containing the ID, and finally the
+    test_video.mp4 fallback — all tracked in one os.scandir pass instead of
+    three glob traversals.
+    """
+    exact_prefix = f"{video_id}."
+    partial_match = None
+    fallback = None
+
+    try:
+        with os.scandir(video_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(exact_prefix):
+                    return PathLib(entry.path)
+                if partial_match is None and video_id in entry.name:
+                    partial_match = PathLib(entry.path)
+                elif entry.name == "test_video.mp4":
+                    fallback = PathLib(entry.path)
+    except FileNotFoundError:
+        return None
+
+    if partial_match is not None:
+        logger.warning(f"No exact match for video ID: {video_id}, using partial match")
+        return partial_match
+
+    if fallback is not None:
+        logger.warning(f"Using test_video.mp4 as fallback for video ID: {video_id}")
+        return fallback
+
+    return None
 
 @router.post("/extract", response_model=FrameExtractionResponse)
 async def extract_frames(request: FrameExtractionRequest, background_tasks: BackgroundTasks):
@@ -183,36 +277,29 @@ async def extract_frames(request: FrameExtractionRequest, background_tasks: Back
     This endpoint starts a background task to extract frames from a video.
     The task will run asynchronously and update the task status.
     """
+    global _extractions_pending
+
     video_id = request.video_id
     logger.info(f"Received frame extraction request for video ID: {video_id}")
-    
+
+    # Shed load before doing any work if the extraction backlog is full
+    if _extractions_pending >= _MAX_PENDING_EXTRACTIONS:
+        logger.warning(f"Extraction backlog full ({_extractions_pending} pending), rejecting video {video_id}")
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy processing other videos, please retry later"
+        )
+
     # Construct video path from the ID
     video_dir = PathLib(settings.UPLOAD_DIR) / "videos"
     logger.info(f"Looking for video in directory: {video_dir}")
-    
-    # First try exact match with the ID
-    video_files = list(video_dir.glob(f"{video_id}.*"))
-    logger.info(f"Found {len(video_files)} files with exact match pattern '{video_id}.*'")
-    
-    # If no exact match, try to find a file that contains the ID
-    if not video_files:
-        logger.warning(f"No exact match for video ID: {video_id}, trying partial match")
-        all_files = list(video_dir.glob("*.*"))
-        logger.info(f"Total files in directory: {len(all_files)}")
-        logger.info(f"Files in directory: {[f.name for f in all_files]}")
-        video_files = [f for f in all_files if video_id in f.name]
-        logger.info(f"Found {len(video_files)} files with partial match")
-    
-    # If still no match, try the test video as a fallback
-    if not video_files and os.path.exists(str(video_dir / "test_video.mp4")):
-        logger.warning(f"Using test_video.mp4 as fallback for video ID: {video_id}")
-        video_files = [video_dir / "test_video.mp4"]
-    
-    if not video_files:
+
+    video_file = _find_video_file(video_dir, video_id)
+    if video_file is None:
         logger.error(f"Video not found for ID: {video_id}")
         raise VideoNotFoundError(video_id)
-    
-    video_path = str(video_files[0])
+
+    video_path = str(video_file)
     logger.info(f"Found video file: {video_path}")
     
     # Create configuration for the analyzer
@@ -248,9 +335,14 @@ async def extract_frames(request: FrameExtractionRequest, background_tasks: Back
         "updated_at": now
     }
     
-    active_tasks[task_id] = task_info
+    await task_store.put(task_id, task_info)
     logger.info(f"Created task {task_id} for video {video_id}")
     
+    # Claim the backlog slot before scheduling: the background task only
+    # starts after the response is sent, so a burst of requests would
+    # otherwise all observe an empty backlog and be accepted
+    _extractions_pending += 1
+
     # Add task to background tasks
     background_tasks.add_task(
         process_video_frames,
@@ -267,38 +359,50 @@ async def get_task_status(task_id: str):
     """
     Get the status of a frame extraction task.
     """
-    if task_id not in active_tasks:
+    task_info = await task_store.get(task_id)
+    if task_info is None:
         raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
-    
-    return FrameExtractionResponse(**active_tasks[task_id])
+
+    return FrameExtractionResponse(**task_info)
 
 @router.get("/{video_id}", response_model=FramesListResponse)
-async def list_frames(video_id: str, selected_only: bool = False, request: Request = None):
+async def list_frames(video_id: str, selected_only: bool = False, request: Request = None, response: Response = None):
     """
     List extracted frames for a video.
-    
+
     Args:
         video_id: ID of the video
         selected_only: If True, only return frames that have been marked as selected
         request: The FastAPI request object
+        response: The FastAPI response object (used to attach the ETag)
     """
     # Get the output directory for this video
     frames_dir = get_frame_output_dir(video_id)
-    
+
     if not frames_dir.exists():
         return FramesListResponse(
             video_id=video_id,
             frames_count=0,
             frames=[]
         )
-    
-    # Load metadata
-    frames_metadata = load_frame_metadata(video_id)
-    
-    # Filter selected frames if requested
-    if selected_only:
-        frames_metadata = [frame for frame in frames_metadata if frame.get('selected', False)]
-    
+
+    # Revalidate against the metadata file's mtime so pollers whose data
+    # hasn't changed get an empty 304 instead of a re-serialized list
+    etag = None
+    try:
+        etag = f'W/"{os.stat(frames_dir / "metadata.json").st_mtime_ns}"'
+    except FileNotFoundError:
+        pass
+    if etag is not None:
+        if request is not None and request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
+        if response is not None:
+            response.headers["ETag"] = etag
+
+    # Load metadata, filtering to selected frames inside the loader so
+    # unselected records are dropped before any per-frame work
+    frames_metadata = load_frame_metadata(video_id, selected_only=selected_only)
+
     # If no metadata found, return empty response
     if not frames_metadata:
         # Fallback to scanning directory if metadata doesn't exist
@@ -310,9 +414,26 @@ async def list_frames(video_id: str, selected_only: bool = False, request: Reque
                 frames=[]
             )
         
+        # Read dimensions from JPEG headers concurrently in the thread pool
+        # so the event loop isn't blocked decoding images
+        dims = await asyncio.gather(
+            *(asyncio.to_thread(_read_jpeg_dims, str(f)) for f in frame_files)
+        )
+
+        # Thumbnail names mirror frame names, so one scandir of the
+        # thumbnails directory plus precomputed path/URL prefixes replaces
+        # a stat and a URL conversion per frame
+        thumbnails_dir = frames_dir / "thumbnails"
+        try:
+            thumb_existing = {e.name for e in os.scandir(thumbnails_dir)}
+        except FileNotFoundError:
+            thumb_existing = set()
+        thumb_path_base = str(thumbnails_dir) + os.sep
+        thumb_url_base = convert_path_to_url(request, thumb_path_base)
+
         # Create basic metadata from files (this is legacy support for frames extracted before metadata)
         frames = []
-        for frame_file in frame_files:
+        for frame_file, (width, height) in zip(frame_files, dims):
             try:
                 # Parse frame ID from filename (format: timestamp_uuid.jpg)
                 file_parts = frame_file.stem.split('_')
@@ -320,23 +441,18 @@ async def list_frames(video_id: str, selected_only: bool = False, request: Reque
                     frame_id = file_parts[-1]  # The last part should be the UUID
                 else:
                     frame_id = str(uuid.uuid4())  # Fallback
-                
-                # Check for thumbnail
-                thumbnail_path = frames_dir / "thumbnails" / frame_file.name
-                thumbnail_path_str = str(thumbnail_path) if thumbnail_path.exists() else None
-                
+
+                # Check for thumbnail lexically against the scanned set
+                if frame_file.name in thumb_existing:
+                    thumbnail_path_str = thumb_path_base + frame_file.name
+                    thumbnail_url = thumb_url_base + frame_file.name
+                else:
+                    thumbnail_path_str = None
+                    thumbnail_url = None
+
                 # Convert paths to URLs
                 file_url = convert_path_to_url(request, str(frame_file))
-                thumbnail_url = convert_path_to_url(request, thumbnail_path_str)
-                
-                # Get image dimensions if possible
-                try:
-                    import cv2
-                    img = cv2.imread(str(frame_file))
-                    height, width = img.shape[:2]
-                except:
-                    width, height = 1280, 720  # Fallback dimensions
-                
+
                 # Create frame data
                 frames.append(
                     FrameData(
@@ -369,37 +485,45 @@ async def list_frames(video_id: str, selected_only: bool = False, request: Reque
             frames=frames
         )
     
+    # Scan the frames directory (and thumbnails) once so existence checks
+    # in the loop are set lookups instead of two stat syscalls per frame
+    existing = {e.name for e in os.scandir(frames_dir)}
+    try:
+        thumb_existing = {e.name for e in os.scandir(frames_dir / "thumbnails")}
+    except FileNotFoundError:
+        thumb_existing = set()
+
     # Convert metadata to FrameData objects
     frames = []
     for frame_meta in frames_metadata:
         try:
             # Check if thumbnail exists
             thumbnail_path = frame_meta.get('thumbnail_path')
-            if thumbnail_path and not os.path.exists(thumbnail_path):
+            if thumbnail_path and os.path.basename(thumbnail_path) not in thumb_existing:
                 thumbnail_path = None
-            
+
             # Check if main image exists
             file_path = frame_meta.get('file_path')
-            if not file_path or not os.path.exists(file_path):
+            if not file_path or os.path.basename(file_path) not in existing:
                 continue  # Skip this frame if the file doesn't exist
             
             # Convert paths to URLs
             file_url = convert_path_to_url(request, file_path)
             thumbnail_url = convert_path_to_url(request, thumbnail_path)
             
-            # Convert created_at from string to datetime if needed
+            # save_frame_metadata always stores created_at as an ISO
+            # string, so decode it uniformly (fromisoformat is a C-level
+            # parse on the common format) instead of type-sniffing
             created_at = frame_meta.get('created_at')
-            if isinstance(created_at, str):
-                try:
-                    created_at = datetime.fromisoformat(created_at)
-                except:
-                    created_at = datetime.now()
-            elif not isinstance(created_at, datetime):
-                created_at = datetime.now()
-            
-            # Create FrameData object
+            created_at = datetime.fromisoformat(created_at) if created_at else datetime.now()
+
+
+            # Create FrameData object. The metadata was validated when it
+            # was written, so model_construct skips re-running Pydantic
+            # validation on every frame of the response
+            metrics_meta = frame_meta.get('metrics', {})
             frames.append(
-                FrameData(
+                FrameData.model_construct(
                     frame_id=frame_meta.get('frame_id'),
                     video_id=frame_meta.get('video_id', video_id),
                     frame_number=frame_meta.get('frame_number', 0),
@@ -409,11 +533,11 @@ async def list_frames(video_id: str, selected_only: bool = False, request: Reque
                     thumbnail_path=thumbnail_path,
                     file_url=file_url,  # Add URL
                     thumbnail_url=thumbnail_url,  # Add URL
-                    metrics=FrameMetrics(
-                        sharpness=frame_meta.get('metrics', {}).get('sharpness', 0.0),
-                        brightness=frame_meta.get('metrics', {}).get('brightness', 0.0),
-                        contrast=frame_meta.get('metrics', {}).get('contrast', 0.0),
-                        quality_score=frame_meta.get('metrics', {}).get('quality_score', 0.0)
+                    metrics=FrameMetrics.model_construct(
+                        sharpness=metrics_meta.get('sharpness', 0.0),
+                        brightness=metrics_meta.get('brightness', 0.0),
+                        contrast=metrics_meta.get('contrast', 0.0),
+                        quality_score=metrics_meta.get('quality_score', 0.0)
                     ),
                     width=frame_meta.get('width', 1280),
                     height=frame_meta.get('height', 720),
@@ -500,13 +624,13 @@ async def unselect_frames(request: FrameSelectionRequest):
     )
 
 @router.get("/{video_id}/selected", response_model=FramesListResponse)
-async def get_selected_frames(video_id: str):
+async def get_selected_frames(video_id: str, request: Request, response: Response):
     """
     Get only the frames that have been marked as selected.
-    
+
     This is a convenience endpoint that is equivalent to /frames/{video_id}?selected_only=true
     """
-    return await list_frames(video_id, selected_only=True)
+    return await list_frames(video_id, selected_only=True, request=request, response=response)
 
 @router.delete("/{video_id}")
 async def delete_frames(video_id: str, frame_ids: Optional[List[str]] = Query(None)):
@@ -522,26 +646,36 @@ async def delete_frames(video_id: str, frame_ids: Optional[List[str]] = Query(No
         raise FrameNotFoundError(video_id=video_id)
     
     if frame_ids:
+        # Scan the directory once and index files by their frame ID suffix
+        # so each requested ID is an O(1) lookup instead of a glob traversal
+        by_id: Dict[str, List[os.DirEntry]] = {}
+        with os.scandir(frames_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".jpg"):
+                    continue
+                stem = entry.name.rsplit('.', 1)[0]
+                fid = stem.rsplit('_', 1)[-1]
+                by_id.setdefault(fid, []).append(entry)
+
         # Delete specific frames
         deleted_count = 0
         for frame_id in frame_ids:
-            # Find files with this frame ID
-            frame_files = list(frames_dir.glob(f"*_{frame_id}.jpg"))
-            for frame_file in frame_files:
+            for entry in by_id.get(frame_id, []):
                 # Delete the frame
                 try:
-                    frame_file.unlink(missing_ok=True)
+                    os.unlink(entry.path)
+                except FileNotFoundError:
+                    pass
                 except Exception as e:
-                    logger.error(f"Error deleting frame file {frame_file}: {e}")
-                
+                    logger.error(f"Error deleting frame file {entry.path}: {e}")
+
                 # Delete the thumbnail if it exists
-                thumbnail_path = frames_dir / "thumbnails" / frame_file.name
-                if thumbnail_path.exists():
-                    try:
-                        thumbnail_path.unlink()
-                    except Exception as e:
-                        logger.error(f"Error deleting thumbnail {thumbnail_path}: {e}")
-                
+                thumbnail_path = frames_dir / "thumbnails" / entry.name
+                try:
+                    thumbnail_path.unlink(missing_ok=True)
+                except Exception as e:
+                    logger.error(f"Error deleting thumbnail {thumbnail_path}: {e}")
+
                 deleted_count += 1
         
         # Update metadata
@@ -562,66 +696,74 @@ async def delete_frames(video_id: str, frame_ids: Optional[List[str]] = Query(No
                 details={"video_id": video_id}
             )
 
-@router.get("/debug/{video_id}")
-async def debug_video_id(video_id: str):
-    """
-    Debug endpoint to verify video ID handling.
-    """
-    # Construct video path from the ID
-    video_dir = PathLib(settings.UPLOAD_DIR) / "videos"
-    video_files = list(video_dir.glob(f"{video_id}.*"))
-    
-    # Check if results directory exists
-    frames_dir = get_frame_output_dir(video_id)
-    
-    return {
-        "video_id": video_id,
-        "video_files_found": [str(f) for f in video_files],
-        "video_files_exist": len(video_files) > 0,
-        "frames_dir": str(frames_dir),
-        "frames_dir_exists": frames_dir.exists(),
-        "upload_dir": str(video_dir),
-        "upload_dir_exists": video_dir.exists()
-    }
+# Bounds how many videos are analyzed at once — extraction is CPU-bound,
+# so unbounded concurrency would thrash the cores
+_extraction_sem = asyncio.Semaphore(settings.FRAME_EXTRACTION.MAX_CONCURRENT_EXTRACTIONS)
+
+# Number of extraction tasks running or waiting for a slot. When the
+# backlog on top of the running slots is full, /extract returns 503
+# instead of queueing unbounded work.
+_extractions_pending = 0
+_MAX_PENDING_EXTRACTIONS = (
+    settings.FRAME_EXTRACTION.MAX_CONCURRENT_EXTRACTIONS
+    + settings.FRAME_EXTRACTION.EXTRACT_BACKLOG
+)
 
 # Background task to process video frames
 async def process_video_frames(task_id: str, video_path: str, config: dict):
     """
     Background task to process video frames.
+
+    The OpenCV work runs in worker threads via asyncio.to_thread so the
+    event loop keeps serving requests during extraction.
     """
-    if task_id not in active_tasks:
-        logger.error(f"Task {task_id} not found in active tasks")
-        return
-    
-    task_info = active_tasks[task_id]
-    video_id = task_info["video_id"]
-    logger.info(f"Starting frame extraction for task {task_id}, video {video_id}")
-    
-    task_info["status"] = "processing"
-    task_info["updated_at"] = datetime.now()
-    
+    # The backlog slot was claimed by /extract before this task was
+    # scheduled; release it however the task exits
+    global _extractions_pending
+    try:
+        task_info = await task_store.get(task_id)
+        if task_info is None:
+            logger.error(f"Task {task_id} not found in task store")
+            return
+
+        video_id = task_info["video_id"]
+        logger.info(f"Starting frame extraction for task {task_id}, video {video_id}")
+
+        async with _extraction_sem:
+            await _process_video_frames(task_id, task_info, video_id, video_path, config)
+    finally:
+        _extractions_pending -= 1
+
+async def _process_video_frames(task_id: str, task_info: Dict, video_id: str, video_path: str, config: dict):
+    await task_store.update(task_id, status="processing", updated_at=datetime.now())
+
     try:
         # Ensure results directory exists
         frames_dir = get_frame_output_dir(video_id)
         logger.info(f"Output directory: {frames_dir}")
         
-        # Create analyzer
+        # Create analyzer (imported lazily to keep it off the startup path)
+        from app.services.frame_extraction.analyzer import FrameAnalyzer
+
         logger.info(f"Creating analyzer for video: {video_path}")
         analyzer = FrameAnalyzer(video_path, config)
         
-        # Extract frames
+        # Extract frames off the event loop thread
         logger.info(f"Analyzing video for task {task_id}")
-        frames = analyzer.analyze_video()
-        
+        frames = await asyncio.to_thread(analyzer.analyze_video)
+
         # Update task info
-        task_info["frames_processed"] = task_info["total_frames"]
-        task_info["frames_extracted"] = len(frames)
-        task_info["updated_at"] = datetime.now()
-        
+        await task_store.update(
+            task_id,
+            frames_processed=task_info["total_frames"],
+            frames_extracted=len(frames),
+            updated_at=datetime.now()
+        )
+
         # Save frames
         if frames:
             logger.info(f"Saving {len(frames)} frames for video {video_id}")
-            saved_frames = analyzer.save_frames(frames)
+            saved_frames = await asyncio.to_thread(analyzer.save_frames, frames)
             
             # Save metadata for easy retrieval later
             logger.info(f"Saving metadata for {len(saved_frames)} frames")
@@ -632,12 +774,9 @@ async def process_video_frames(task_id: str, video_path: str, config: dict):
             logger.warning(f"No frames extracted for video {video_id}")
         
         # Mark task as complete
-        task_info["status"] = "completed"
-        task_info["updated_at"] = datetime.now()
+        await task_store.update(task_id, status="completed", updated_at=datetime.now())
         logger.info(f"Task {task_id} completed successfully")
-        
+
     except Exception as e:
         logger.error(f"Error processing video frames for task {task_id}: {e}", exc_info=True)
-        task_info["status"] = "failed"
-        task_info["error"] = str(e)
-        task_info["updated_at"] = datetime.now() 
\ No newline at end of file
+        await task_store.update(task_id, status="failed", error=str(e), updated_at=datetime.now()) 
\ No newline at end of file
@@ -5,6 +5,28 @@ import time
 
 router = APIRouter()
 
+# Platform facts never change after import, so resolve them once
+_PLATFORM = platform.platform()
+_PYTHON_VERSION = platform.python_version()
+
+# System stats cached for a couple of seconds — liveness probes hit this
+# endpoint frequently and shouldn't pay for psutil on every call
+_SYS_STATS_TTL = 2.0
+_last_sys_stats = (0.0, {})
+
+def _get_sys_stats() -> dict:
+    global _last_sys_stats
+    now = time.monotonic()
+    cached_at, stats = _last_sys_stats
+    if now - cached_at < _SYS_STATS_TTL:
+        return stats
+    stats = {
+        "cpu_percent": psutil.cpu_percent(interval=None),
+        "memory_percent": psutil.virtual_memory().percent
+    }
+    _last_sys_stats = (now, stats)
+    return stats
+
 @router.get("/health")
 async def health_check():
     """
@@ -15,9 +37,8 @@ async def health_check():
         "service": "clipcraft-api",
         "timestamp": time.time(),
         "system": {
-            "platform": platform.platform(),
-            "python": platform.python_version(),
-            "cpu_percent": psutil.cpu_percent(),
-            "memory_percent": psutil.virtual_memory().percent
+            "platform": _PLATFORM,
+            "python": _PYTHON_VERSION,
+            **_get_sys_stats()
         }
-    } 
\ No newline at end of file
+    }
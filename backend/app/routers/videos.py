@@ -9,11 +9,19 @@ import tempfile
 import os
 
 from app.core.config import settings
-from app.services.video import save_uploaded_video, cleanup_original_video
+from app.services.video import (
+    UploadTooLargeError,
+    save_uploaded_video,
+    save_video_stream,
+    cleanup_original_video,
+)
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Bounds concurrent uploads so large files don't contend for disk writes
+_upload_gate = asyncio.Semaphore(min(4, os.cpu_count() or 1))
+
 
 class VideoResponse(BaseModel):
     id: str
@@ -46,7 +54,8 @@ async def upload_video(
         logger.info(f"Starting upload of video: {file.filename}, content type: {file.content_type}")
         
         # Save the uploaded video
-        video_data = await save_uploaded_video(file)
+        async with _upload_gate:
+            video_data = await save_uploaded_video(file)
         logger.info(f"Video uploaded successfully: {video_data['id']}, size: {video_data['size'] / (1024 * 1024):.2f} MB")
         
         # Convert to response model
@@ -65,6 +74,47 @@ async def upload_video(
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
 
+@router.post("/upload/stream", response_model=VideoResponse)
+async def upload_video_stream(request: Request, filename: Optional[str] = None):
+    """
+    Upload a video as a raw request body, bypassing multipart parsing.
+    The body is streamed straight to disk chunk by chunk, so memory use
+    stays constant regardless of file size.
+    """
+    # Check the declared content type
+    content_type = request.headers.get("content-type", "")
+    if not content_type.startswith("video/"):
+        raise HTTPException(status_code=400, detail="File must be a video")
+
+    # Reject uploads that declare a size above the limit before reading;
+    # chunked bodies carry no Content-Length and are capped in the write
+    # loop instead
+    content_length = request.headers.get("content-length")
+    if content_length and int(content_length) > settings.MAX_UPLOAD_SIZE:
+        raise HTTPException(status_code=413, detail="File exceeds maximum upload size")
+
+    try:
+        logger.info(f"Starting raw stream upload: {filename}, content type: {content_type}")
+
+        async with _upload_gate:
+            video_data = await save_video_stream(request.stream(), filename)
+        logger.info(f"Video uploaded successfully: {video_data['id']}, size: {video_data['size'] / (1024 * 1024):.2f} MB")
+
+        return VideoResponse(
+            id=video_data["id"],
+            filename=video_data["filename"],
+            original_filename=video_data["original_filename"],
+            upload_time=video_data["upload_time"],
+            size=video_data["size"],
+        )
+
+    except UploadTooLargeError:
+        raise HTTPException(status_code=413, detail="File exceeds maximum upload size")
+    except Exception as e:
+        logger.error(f"Error during video stream upload: {e}")
+        raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
+
+
 @router.delete("/{video_id}")
 async def delete_video(video_id: str):
     """
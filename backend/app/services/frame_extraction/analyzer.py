@@ -9,14 +9,18 @@ import logging
 from pathlib import Path
 from datetime import datetime
 import multiprocessing as mp
-from functools import partial
+import multiprocessing.pool
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from tqdm import tqdm
 from typing import Dict, List, Optional, Tuple, Any, Union
 import uuid
 from PIL import Image
 
 from app.core.config import settings
-from app.services.frame_extraction.utils import get_video_info, get_frame_output_dir, timestamp_to_filename
+from app.services.frame_extraction.utils import get_video_info, get_frame_output_dir, open_video_capture, timestamp_to_filename
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +29,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Sample rate above which seek-based sampling beats grabbing through
+# every intermediate frame
+_SEEK_THRESHOLD = 30
+
+# End-of-stream sentinel for the decode pipeline queue
+_EOF = object()
+
+# Per-thread scratch buffers for the analysis kernels. Frames within a
+# video share one resolution, so each pool thread can reuse its dst
+# arrays across frames instead of allocating four temporaries per frame.
+_TLS = threading.local()
+
+def _tls_buffer(name: str, shape: Tuple[int, ...], dtype) -> np.ndarray:
+    buf = getattr(_TLS, name, None)
+    if buf is None or buf.shape != shape:
+        buf = np.empty(shape, dtype)
+        setattr(_TLS, name, buf)
+    return buf
+
 class FrameAnalyzer:
     """
     Extracts and analyzes frames from videos to identify high-quality keyframes.
@@ -74,13 +97,28 @@ class FrameAnalyzer:
             'thumbnail_quality',
             settings.FRAME_EXTRACTION.THUMBNAIL_QUALITY
         )
+        self.seek_sampling = self.config.get('seek_sampling', False)
+
+        # Run the pixel kernels on the GPU when OpenCV was built with
+        # CUDA and a device is present; CPU-only builds fall back silently
+        try:
+            self._use_gpu = cv2.cuda.getCudaEnabledDeviceCount() > 0
+        except (AttributeError, cv2.error):
+            self._use_gpu = False
         
         # Validate video path
         if not os.path.exists(self.video_path):
             raise FileNotFoundError(f"Video file not found: {self.video_path}")
-            
-        # Get video info
-        self.video_info = get_video_info(self.video_path)
+
+        # Derived once — every frame record carries these, and parsing the
+        # path per frame adds up across thousands of frames
+        self.video_id = Path(self.video_path).stem
+        self._batch_created_at = datetime.now().isoformat()
+
+        # Open the video once and keep the handle for analyze_video —
+        # opening can cost seconds on slow or networked sources
+        self._cap = open_video_capture(self.video_path)
+        self.video_info = get_video_info(self.video_path, cap=self._cap)
         self.logger.info(f"Video info: {self.video_info}")
     
     def analyze_video(self, sample_rate: Optional[int] = None) -> List[Dict]:
@@ -95,91 +133,208 @@ class FrameAnalyzer:
         """
         # Use provided sample_rate if given, otherwise use configured value
         effective_sample_rate = sample_rate if sample_rate is not None else self.sample_rate
+
+        # All frames from this run share one creation timestamp
+        self._batch_created_at = datetime.now().isoformat()
         
         self.logger.info(f"Analyzing video: {self.video_path} (sample rate: {effective_sample_rate})")
         
-        # Open the video
-        cap = cv2.VideoCapture(self.video_path)
+        # Reuse the capture opened in __init__; a repeat call (the handle
+        # was consumed and released last time) opens a fresh one
+        cap, self._cap = self._cap, None
+        if cap is None or not cap.isOpened():
+            cap = open_video_capture(self.video_path)
         if not cap.isOpened():
             raise ValueError(f"Could not open video: {self.video_path}")
         
         # Get video properties
         fps = self.video_info['fps']
         frame_count = self.video_info['frame_count']
-        
-        # Gather frames to analyze based on sample rate
-        frames_to_process = []
-        frame_number = 0
-        
-        with tqdm(total=frame_count//effective_sample_rate, desc="Reading frames") as pbar:
-            while cap.isOpened():
-                ret, frame = cap.read()
-                if not ret:
-                    break
-                    
-                if frame_number % effective_sample_rate == 0:
-                    frames_to_process.append((frame, frame_number, fps))
-                    pbar.update(1)
-                    
-                frame_number += 1
-                
-        cap.release()
-        
-        frames_to_process_count = len(frames_to_process)
-        self.logger.info(f"Processing {frames_to_process_count} frames")
-        
+
+        # Stream sampled frames straight from the decoder into the
+        # analysis stage — materializing them first would hold every raw
+        # BGR frame in memory at once
+        expected_count = frame_count // effective_sample_rate
+        frame_iter = self._pipeline_frames(
+            self._iter_sampled_frames(cap, effective_sample_rate, frame_count, fps)
+        )
+
+        self.logger.info(f"Processing ~{expected_count} sampled frames")
+
         # Process frames based on parallel or sequential mode
-        if self.use_parallel and frames_to_process_count > 100:
-            frames_data = self._process_frames_parallel(frames_to_process)
-        else:
-            frames_data = self._process_frames_sequential(frames_to_process)
-        
-        # Filter frames by quality score if needed
-        if self.min_quality_score > 0:
-            original_count = len(frames_data)
-            frames_data = [f for f in frames_data if f['metrics']['quality_score'] >= self.min_quality_score]
-            self.logger.info(f"Filtered {original_count - len(frames_data)} frames below quality threshold")
-        
-        # Sort frames by quality score in descending order
-        frames_data.sort(key=lambda x: x['metrics']['quality_score'], reverse=True)
-        
-        # Limit the number of frames if needed
-        if self.max_frames > 0 and len(frames_data) > self.max_frames:
-            frames_data = frames_data[:self.max_frames]
-            self.logger.info(f"Limited to {self.max_frames} frames")
+        try:
+            if self.use_parallel and expected_count > 100:
+                frames_data = self._process_frames_parallel(frame_iter, expected_count)
+            else:
+                frames_data = self._process_frames_sequential(frame_iter, expected_count)
+        finally:
+            # Shut the decode pipeline down before releasing the capture:
+            # if processing bailed early the producer thread may still be
+            # inside cap.grab() or blocked on the queue, and releasing the
+            # capture under it is a native use-after-free
+            frame_iter.close()
+            cap.release()
+        
+        # Pull the quality scores into a numpy column once, then filter
+        # and rank with vectorized ops instead of a Python comprehension
+        # plus a key-function sort over the dicts
+        if frames_data:
+            quality = np.fromiter(
+                (f['metrics']['quality_score'] for f in frames_data),
+                dtype=np.float32, count=len(frames_data)
+            )
+
+            # Filter frames by quality score if needed
+            if self.min_quality_score > 0:
+                mask = quality >= self.min_quality_score
+                kept = int(mask.sum())
+                if kept < len(frames_data):
+                    self.logger.info(f"Filtered {len(frames_data) - kept} frames below quality threshold")
+                    frames_data = [frames_data[i] for i in np.flatnonzero(mask)]
+                    quality = quality[mask]
+
+            # Rank by quality score (descending) and apply the frame limit
+            order = np.argsort(-quality, kind='stable')
+            if self.max_frames > 0 and len(order) > self.max_frames:
+                order = order[:self.max_frames]
+                self.logger.info(f"Limited to {self.max_frames} frames")
+            frames_data = [frames_data[i] for i in order]
         
         self.logger.info(f"Analyzed {frame_count} frames, extracted {len(frames_data)} high-quality frames")
         return frames_data
     
-    def _process_frames_sequential(self, frames_to_process: List[Tuple]) -> List[Dict]:
-        """Process frames sequentially."""
+    def _iter_sampled_frames(self, cap, effective_sample_rate: int, frame_count: int, fps: float):
+        """
+        Yield (frame, frame_number, fps) tuples for sampled frames.
+
+        Frames are produced lazily so peak memory stays at a handful of
+        in-flight frames instead of the whole sampled set.
+        """
+        if self.seek_sampling and effective_sample_rate > _SEEK_THRESHOLD:
+            # At sparse sample rates it is cheaper to seek straight to each
+            # sampled index than to grab through every intermediate frame
+            for frame_number in range(0, frame_count, effective_sample_rate):
+                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+                ret, frame = cap.read()
+                if not ret:
+                    return
+                yield frame, frame_number, fps
+        else:
+            frame_number = 0
+            while True:
+                # grab() advances the decoder without reconstructing the
+                # image, so skipped frames cost a fraction of a full read;
+                # retrieve() pays the decode only on sampled frames
+                if not cap.grab():
+                    return
+
+                if frame_number % effective_sample_rate == 0:
+                    ret, frame = cap.retrieve()
+                    if ret:
+                        yield frame, frame_number, fps
+
+                frame_number += 1
+
+    def _pipeline_frames(self, frame_iter, maxsize: int = 16):
+        """
+        Run the frame reader in a producer thread behind a bounded queue.
+
+        Decoding overlaps analysis this way — cv2's read/grab calls
+        release the GIL, so the producer decodes the next frames while the
+        consumer (or pool) analyzes the current ones. The queue bound caps
+        how far decode can run ahead; a sentinel marks end of stream.
+
+        Closing the generator stops and joins the producer, so callers
+        that may abandon it early must close() it before releasing the
+        capture that backs frame_iter.
+        """
+        frame_queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        stop = threading.Event()
+
+        def _put(item) -> bool:
+            # Bounded put that gives up once the consumer signals stop, so
+            # a full queue can't wedge the thread after the consumer has
+            # gone away
+            while not stop.is_set():
+                try:
+                    frame_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def produce():
+            try:
+                for item in frame_iter:
+                    if not _put(item):
+                        return
+            finally:
+                _put(_EOF)
+
+        producer = threading.Thread(target=produce, name="frame-decoder", daemon=True)
+        producer.start()
+
+        try:
+            while True:
+                item = frame_queue.get()
+                if item is _EOF:
+                    return
+                yield item
+        finally:
+            # Runs on normal exhaustion and on close()/GeneratorExit when
+            # the consumer bails early: stop the producer and wait for it
+            # before control returns to whoever owns the capture
+            stop.set()
+            producer.join()
+
+    def _process_frames_sequential(self, frame_iter, expected_count: int) -> List[Dict]:
+        """Process frames sequentially, consuming the reader lazily."""
         frames_data = []
-        
+
         # Set up progress bar
-        with tqdm(total=len(frames_to_process), desc="Analyzing frames") as pbar:
-            for frame_batch in frames_to_process:
+        with tqdm(total=expected_count, desc="Analyzing frames") as pbar:
+            for frame_batch in frame_iter:
                 frame_data = self._process_frame_batch(frame_batch)
                 # Only add frames that passed quality checks
                 if frame_data['frame'] is not None:
                     frames_data.append(frame_data)
                 pbar.update(1)
-        
+
         return frames_data
-    
-    def _process_frames_parallel(self, frames_to_process: List[Tuple]) -> List[Dict]:
-        """Process frames using parallel workers."""
-        # Process frames in parallel
-        self.logger.info(f"Processing {len(frames_to_process)} frames in parallel with {self.max_workers} workers")
-        with mp.Pool(processes=self.max_workers) as pool:
-            all_results = list(tqdm(
-                pool.imap(self._process_frame_batch, frames_to_process),
-                total=len(frames_to_process),
-                desc="Processing frames"
-            ))
-        
-        # Filter out rejected frames
-        frames_data = [result for result in all_results if result['frame'] is not None]
-        
+
+    def _process_frames_parallel(self, frame_iter, expected_count: int) -> List[Dict]:
+        """Process frames using parallel workers, streaming from the reader."""
+        workers = self.max_workers or os.cpu_count() or 1
+
+        # A one-worker pool only adds scheduling and pickling overhead
+        if workers == 1:
+            return self._process_frames_sequential(frame_iter, expected_count)
+
+        self.logger.info(f"Processing ~{expected_count} frames in parallel with {workers} workers")
+
+        # Bound in-flight frames so the pool's feeder thread can't pull
+        # the whole video into memory ahead of the workers. The bound
+        # leaves room for a full chunk per worker plus one being formed.
+        chunksize = 4
+        inflight = threading.BoundedSemaphore(chunksize * (workers + 1))
+
+        def bounded_iter():
+            for item in frame_iter:
+                inflight.acquire()
+                yield item
+
+        # The per-frame work is OpenCV kernels, which release the GIL, so
+        # threads parallelize as well as processes here — without fork
+        # cost or any serialization of frames between address spaces
+        frames_data = []
+        with mp.pool.ThreadPool(processes=workers) as pool:
+            results = pool.imap_unordered(self._process_frame_batch, bounded_iter(), chunksize=chunksize)
+            for result in tqdm(results, total=expected_count, desc="Processing frames"):
+                inflight.release()
+                # Filter out rejected frames
+                if result['frame'] is not None:
+                    frames_data.append(result)
+
         return frames_data
     
     def _process_frame_batch(self, batch_data: Tuple) -> Dict:
@@ -187,14 +342,26 @@ class FrameAnalyzer:
         frame, frame_number, fps = batch_data
         
         # Step 1: Quick quality check first (80/20 principle)
-        laplacian_var, brightness, _ = self._quick_frame_quality(frame)
+        if self._use_gpu:
+            try:
+                laplacian_var, brightness, _ = self._quick_frame_quality_gpu(frame)
+            except (cv2.error, SystemError) as e:
+                # A broken CUDA path (driver, build or filter mismatch)
+                # must not fail the extraction — drop to the CPU kernel
+                # for the rest of the run. CUDA-less builds surface the
+                # cv2.error wrapped in a SystemError from the bindings
+                self.logger.warning(f"CUDA quality check failed, falling back to CPU: {e}")
+                self._use_gpu = False
+                laplacian_var, brightness, _ = self._quick_frame_quality(frame)
+        else:
+            laplacian_var, brightness, _ = self._quick_frame_quality(frame)
         
         # If frame fails quick check, return minimal data with None frame to indicate rejection
         if laplacian_var == -1:
             return {
                 'frame': None,  # Indicates frame should be rejected
                 'frame_id': str(uuid.uuid4()),
-                'video_id': os.path.basename(self.video_path).split('.')[0],
+                'video_id': self.video_id,
                 'frame_number': frame_number,
                 'timestamp': frame_number / fps,
                 'timestamp_formatted': self._format_timestamp(frame_number / fps),
@@ -206,7 +373,7 @@ class FrameAnalyzer:
                 },
                 'width': frame.shape[1],
                 'height': frame.shape[0],
-                'created_at': datetime.now().isoformat()
+                'created_at': self._batch_created_at
             }
         
         # Step 2: Detailed analysis only for promising frames
@@ -220,19 +387,29 @@ class FrameAnalyzer:
         Apply 80/20 principle to quickly evaluate frame quality.
         Returns sharpness if frame passes initial checks, -1 otherwise.
         """
-        # Downsample frame for faster processing
-        small_frame = cv2.resize(frame, (320, 180), interpolation=cv2.INTER_AREA)
-        
+        # Downsample frame for faster processing, reusing this thread's
+        # scratch buffers as dst so no temporaries are allocated per frame
+        small_frame = _tls_buffer('small_bgr', (180, 320, 3), np.uint8)
+        cv2.resize(frame, (320, 180), dst=small_frame, interpolation=cv2.INTER_AREA)
+
         # Convert to grayscale
-        gray = cv2.cvtColor(small_frame, cv2.COLOR_BGR2GRAY)
-        
-        # Quick brightness check (reject very dark/bright frames)
-        brightness = np.mean(gray)
+        gray = _tls_buffer('gray_small', (180, 320), np.uint8)
+        cv2.cvtColor(small_frame, cv2.COLOR_BGR2GRAY, dst=gray)
+
+        # Quick brightness check (reject very dark/bright frames).
+        # cv2.mean runs OpenCV's SIMD reduction on the uint8 buffer
+        # instead of numpy's float64 path
+        brightness = cv2.mean(gray)[0]
         if brightness < 30 or brightness > 220:
             return -1, brightness, 0
             
-        # Quick blur check using Laplacian (most important metric)
-        laplacian_var = cv2.Laplacian(gray, cv2.CV_64F, ksize=1).var()
+        # Quick blur check using Laplacian (most important metric).
+        # CV_16S keeps the integer SIMD kernel and writes 2 bytes/pixel
+        # instead of CV_64F's 8; the values (and hence the variance and
+        # the threshold below) are identical for ksize=1 on uint8 input
+        lap = _tls_buffer('lap', (180, 320), np.int16)
+        cv2.Laplacian(gray, cv2.CV_16S, dst=lap, ksize=1)
+        laplacian_var = cv2.meanStdDev(lap)[1][0, 0] ** 2
         
         # Reject obviously blurry frames
         if laplacian_var < 15:  # Threshold may need adjustment based on content
@@ -240,6 +417,48 @@ class FrameAnalyzer:
             
         return laplacian_var, brightness, 0
     
+    def _quick_frame_quality_gpu(self, frame: np.ndarray) -> Tuple[float, float, float]:
+        """
+        CUDA variant of the quick quality check.
+
+        Resize, grayscale conversion and the Laplacian run on the device;
+        only the tiny 320x180 buffers come back over PCIe for the scalar
+        reductions. Thresholds mirror the CPU path exactly.
+        """
+        stream = getattr(_TLS, 'cuda_stream', None)
+        if stream is None:
+            stream = cv2.cuda.Stream()
+            _TLS.cuda_stream = stream
+            # The CUDA Laplacian only supports dst type == src type, so
+            # the filter runs in CV_32F (exact for uint8 input at
+            # ksize=1) rather than the CPU path's CV_16S
+            _TLS.cuda_lap_filter = cv2.cuda.createLaplacianFilter(cv2.CV_32FC1, cv2.CV_32FC1, ksize=1)
+
+        gpu_frame = cv2.cuda_GpuMat()
+        gpu_frame.upload(frame, stream)
+        gpu_small = cv2.cuda.resize(gpu_frame, (320, 180), interpolation=cv2.INTER_AREA, stream=stream)
+        gpu_gray = cv2.cuda.cvtColor(gpu_small, cv2.COLOR_BGR2GRAY, stream=stream)
+        gpu_gray_f = gpu_gray.convertTo(cv2.CV_32F, stream)
+        gpu_lap = _TLS.cuda_lap_filter.apply(gpu_gray_f, stream=stream)
+
+        gray = gpu_gray.download(stream)
+        lap = gpu_lap.download(stream)
+        stream.waitForCompletion()
+
+        # Quick brightness check (reject very dark/bright frames)
+        brightness = cv2.mean(gray)[0]
+        if brightness < 30 or brightness > 220:
+            return -1, brightness, 0
+
+        # Quick blur check using Laplacian (most important metric)
+        laplacian_var = cv2.meanStdDev(lap)[1][0, 0] ** 2
+
+        # Reject obviously blurry frames
+        if laplacian_var < 15:
+            return -1, brightness, laplacian_var
+
+        return laplacian_var, brightness, 0
+
     def _analyze_detailed_quality(self, frame: np.ndarray, brightness: float, laplacian_var: float) -> Dict:
         """
         Analyze frame quality in detail.
@@ -253,11 +472,19 @@ class FrameAnalyzer:
         Returns:
             Dictionary of quality metrics
         """
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        
-        # Calculate contrast (standard deviation of pixel values)
-        contrast = np.std(gray)
-        
+        gray = _tls_buffer('gray_full', frame.shape[:2], np.uint8)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=gray)
+
+        # Calculate contrast (standard deviation of pixel values) with a
+        # single fused SIMD sweep over the uint8 buffer — np.std would
+        # cast to float64 and walk the image twice
+        mean_, std_ = cv2.meanStdDev(gray)
+        contrast = std_[0, 0]
+
+        # The caller's brightness came from the 320x180 quick check; the
+        # full-resolution mean just fell out of the same sweep, so use it
+        brightness = mean_[0, 0]
+
         # Normalize contrast to 0-100 range
         normalized_contrast = min(100, contrast * 0.5)
         
@@ -290,7 +517,7 @@ class FrameAnalyzer:
         
         return {
             "frame_id": str(uuid.uuid4()),
-            "video_id": os.path.basename(self.video_path).split('.')[0],
+            "video_id": self.video_id,
             "frame_number": frame_number,
             "timestamp": timestamp,
             "timestamp_formatted": timestamp_formatted,
@@ -298,15 +525,19 @@ class FrameAnalyzer:
             "metrics": metrics,
             "width": width,
             "height": height,
-            "created_at": datetime.now().isoformat()
+            "created_at": self._batch_created_at
         }
     
-    def _format_timestamp(self, seconds: float) -> str:
-        """Format seconds to HH:MM:SS."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _format_seconds(total_seconds: int) -> str:
+        hours, rem = divmod(total_seconds, 3600)
+        minutes, secs = divmod(rem, 60)
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
+    def _format_timestamp(self, seconds: float) -> str:
+        """Format seconds to HH:MM:SS, memoized on the whole second."""
+        return self._format_seconds(int(seconds))
     
     def save_frames(self, frames_data: List[Dict], output_dir: Optional[Path] = None, create_thumbnails: bool = True) -> List[Dict]:
         """
@@ -321,7 +552,7 @@ class FrameAnalyzer:
             List of saved frame paths and thumbnail paths
         """
         # Generate video ID from filename if not present
-        video_id = frames_data[0]['video_id'] if frames_data else os.path.basename(self.video_path).split('.')[0]
+        video_id = frames_data[0]['video_id'] if frames_data else self.video_id
         
         # Get output directory
         output_dir = output_dir or get_frame_output_dir(video_id)
@@ -332,24 +563,47 @@ class FrameAnalyzer:
         if create_thumbnails:
             os.makedirs(thumbnails_dir, exist_ok=True)
         
-        saved_frames = []
-        for frame_data in tqdm(frames_data, desc="Saving frames"):
+        # Explicit encode parameters for both sizes: baseline huffman
+        # tables, no optimize pass and no progressive scan keep
+        # libjpeg-turbo on its fast single-pass path. The full-size
+        # quality matches imwrite's previous implicit default of 95.
+        frame_params = [
+            cv2.IMWRITE_JPEG_QUALITY, 95,
+            cv2.IMWRITE_JPEG_OPTIMIZE, 0,
+            cv2.IMWRITE_JPEG_PROGRESSIVE, 0,
+        ]
+        thumb_params = [
+            cv2.IMWRITE_JPEG_QUALITY, self.thumbnail_quality,
+            cv2.IMWRITE_JPEG_OPTIMIZE, 0,
+            cv2.IMWRITE_JPEG_PROGRESSIVE, 0,
+        ]
+
+        def _encode_and_write(path: Path, img: np.ndarray, params: List[int]) -> None:
+            # imencode + a plain byte write beats imwrite on network
+            # filesystems, where imwrite's own IO path adds extra syscalls
+            ok, buf = cv2.imencode('.jpg', img, params)
+            if not ok:
+                raise ValueError(f"Failed to encode JPEG for {path}")
+            with open(path, 'wb') as f:
+                f.write(buf)
+
+        def _write_one(frame_data: Dict) -> Dict:
             frame = frame_data.pop('frame')  # Remove the frame from the data dict
-            
+
             # Create filename
             frame_id = frame_data['frame_id']
             timestamp = frame_data['timestamp']
             filename = f"{timestamp_to_filename(timestamp)}_{frame_id}.jpg"
-            
+
             # Save full-size frame
             frame_path = output_dir / filename
-            cv2.imwrite(str(frame_path), frame)
+            _encode_and_write(frame_path, frame, frame_params)
             frame_data['file_path'] = str(frame_path)
-            
+
             # Create and save thumbnail if requested
             if create_thumbnails:
                 thumbnail_path = thumbnails_dir / filename
-                
+
                 # Resize while maintaining aspect ratio
                 h, w = frame.shape[:2]
                 new_w = self.thumbnail_size[0]
@@ -357,15 +611,23 @@ class FrameAnalyzer:
                 if new_h > self.thumbnail_size[1]:
                     new_h = self.thumbnail_size[1]
                     new_w = int(w * (new_h / h))
-                    
+
                 thumbnail = cv2.resize(frame, (new_w, new_h))
-                
+
                 # Save with compression
-                encode_params = [cv2.IMWRITE_JPEG_QUALITY, self.thumbnail_quality]
-                cv2.imwrite(str(thumbnail_path), thumbnail, encode_params)
+                _encode_and_write(thumbnail_path, thumbnail, thumb_params)
                 frame_data['thumbnail_path'] = str(thumbnail_path)
-            
-            saved_frames.append(frame_data)
-        
+
+            return frame_data
+
+        # JPEG encoding is CPU-bound and OpenCV releases the GIL, so fan
+        # the writes out over a thread pool instead of encoding serially
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            saved_frames = list(tqdm(
+                executor.map(_write_one, frames_data),
+                total=len(frames_data),
+                desc="Saving frames"
+            ))
+
         self.logger.info(f"Saved {len(saved_frames)} frames to {output_dir}")
         return saved_frames 
\ No newline at end of file
@@ -4,17 +4,24 @@ Handles storing and retrieving frame metadata.
 """
 
 import os
-import json
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
 from datetime import datetime
 
+import orjson
+from cachetools import LRUCache
+
 from app.core.config import settings
 from app.services.frame_extraction.utils import get_frame_output_dir
 
 logger = logging.getLogger(__name__)
 
+# Parsed metadata keyed by (video_id, mtime). Saving rewrites the file and
+# bumps its mtime, so stale entries are never served; they just age out of
+# the LRU.
+_metadata_cache: LRUCache = LRUCache(maxsize=256)
+
 def save_frame_metadata(video_id: str, frames_data: List[Dict]) -> bool:
     """
     Save frame metadata to a JSON file.
@@ -34,17 +41,10 @@ def save_frame_metadata(video_id: str, frames_data: List[Dict]) -> bool:
         # Create metadata file path
         metadata_file = output_dir / "metadata.json"
         
-        # Convert datetime objects to ISO format strings for JSON serialization
-        serializable_data = []
-        for frame in frames_data:
-            frame_copy = frame.copy()
-            if isinstance(frame_copy.get('created_at'), datetime):
-                frame_copy['created_at'] = frame_copy['created_at'].isoformat()
-            serializable_data.append(frame_copy)
-        
-        # Write metadata to file
-        with open(metadata_file, 'w') as f:
-            json.dump(serializable_data, f, indent=2)
+        # Write metadata to file (orjson serializes datetimes as ISO
+        # strings natively, so no pre-conversion pass is needed)
+        with open(metadata_file, 'wb') as f:
+            f.write(orjson.dumps(frames_data, option=orjson.OPT_INDENT_2))
         
         logger.info(f"Saved metadata for {len(frames_data)} frames to {metadata_file}")
         return True
@@ -53,13 +53,14 @@ def save_frame_metadata(video_id: str, frames_data: List[Dict]) -> bool:
         logger.error(f"Error saving frame metadata: {e}")
         return False
 
-def load_frame_metadata(video_id: str) -> List[Dict]:
+def load_frame_metadata(video_id: str, *, selected_only: bool = False) -> List[Dict]:
     """
     Load frame metadata from a JSON file.
-    
+
     Args:
         video_id: ID of the video
-        
+        selected_only: If True, return only frames marked as selected
+
     Returns:
         List of frame data dictionaries
     """
@@ -71,15 +72,27 @@ def load_frame_metadata(video_id: str) -> List[Dict]:
         metadata_file = output_dir / "metadata.json"
         
         # Check if metadata file exists
-        if not metadata_file.exists():
+        try:
+            mtime = os.path.getmtime(metadata_file)
+        except FileNotFoundError:
             logger.warning(f"Metadata file not found for video {video_id}")
             return []
-        
-        # Read metadata from file
-        with open(metadata_file, 'r') as f:
-            data = json.load(f)
-        
-        logger.info(f"Loaded metadata for {len(data)} frames from {metadata_file}")
+
+        # Serve the parsed result from cache if the file hasn't changed
+        cache_key = (video_id, mtime)
+        data = _metadata_cache.get(cache_key)
+        if data is None:
+            # Read metadata from file
+            with open(metadata_file, 'rb') as f:
+                data = orjson.loads(f.read())
+
+            _metadata_cache[cache_key] = data
+            logger.info(f"Loaded metadata for {len(data)} frames from {metadata_file}")
+
+        # Filter here rather than in callers so unselected records never
+        # reach the downstream FrameData construction loop
+        if selected_only:
+            return [frame for frame in data if frame.get('selected')]
         return data
     
     except Exception as e:
@@ -103,7 +116,13 @@ def update_frame_selection(video_id: str, frame_ids: List[str], selected: bool =
         frames_data = load_frame_metadata(video_id)
         if not frames_data:
             return False
-        
+
+        # Work on copies: the loader hands out dicts owned by the
+        # metadata cache, and mutating those in place would leave the
+        # cached entry holding selection flags that were never persisted
+        # if the save below fails
+        frames_data = [dict(frame) for frame in frames_data]
+
         # Update selection status
         updated = False
         for frame in frames_data:
@@ -133,14 +152,9 @@ def get_selected_frames(video_id: str) -> List[Dict]:
         List of selected frame data dictionaries
     """
     try:
-        # Load existing metadata
-        frames_data = load_frame_metadata(video_id)
-        
-        # Filter selected frames
-        selected_frames = [frame for frame in frames_data if frame.get('selected', False)]
-        
-        return selected_frames
-    
+        # Load metadata with the selected filter applied by the loader
+        return load_frame_metadata(video_id, selected_only=True)
+
     except Exception as e:
         logger.error(f"Error getting selected frames: {e}")
         return []
@@ -21,9 +21,13 @@ class FrameExtractionConfig(BaseModel):
         description="Minimum quality score for a frame to be considered"
     )
     use_parallel: Optional[bool] = Field(
-        None, 
+        None,
         description="Whether to use parallel processing"
     )
+    seek_sampling: Optional[bool] = Field(
+        None,
+        description="Seek directly to sampled frames for large sample rates"
+    )
 
 class FrameExtractionRequest(BaseModel):
     """Request to extract frames from a video."""
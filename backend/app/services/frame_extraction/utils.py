@@ -14,30 +14,76 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-def get_video_info(video_path: Union[str, Path]) -> Dict:
+# Hardware decode is opt-in: CLIPCRAFT_HWACCEL=1 routes captures through
+# the FFmpeg backend with the h264_cuvid decoder so H.264 decoding runs
+# on NVDEC. H.264-only: video_codec pins the decoder, so non-H.264
+# sources (HEVC, VP9, AV1) will fail to open while the flag is set —
+# enable it only for H.264 libraries. CLIPCRAFT_FAST_PROBE=1
+# additionally skips FFmpeg's long format probe, which can buffer
+# seconds of input on some sources. The options env var must be set
+# before FFmpeg is first used.
+_HWACCEL = os.environ.get("CLIPCRAFT_HWACCEL") == "1"
+_FAST_PROBE = os.environ.get("CLIPCRAFT_FAST_PROBE") == "1"
+
+_FFMPEG_OPTS = []
+if _HWACCEL:
+    _FFMPEG_OPTS.append("video_codec;h264_cuvid")
+if _FAST_PROBE:
+    _FFMPEG_OPTS.append("analyzeduration;0|probesize;32")
+if _FFMPEG_OPTS:
+    os.environ.setdefault("OPENCV_FFMPEG_CAPTURE_OPTIONS", "|".join(_FFMPEG_OPTS))
+
+# Path prefixes identifying live sources rather than files on disk
+_STREAM_PREFIXES = ("rtsp://", "rtmp://", "http://", "https://")
+
+def open_video_capture(video_path: Union[str, Path]) -> cv2.VideoCapture:
+    """
+    Open a VideoCapture for the given path.
+
+    Forces the FFmpeg backend when any capture options are enabled so
+    they take effect, and caps the internal frame buffer on live
+    sources, where the default buffering can lag seconds behind.
+    """
+    path_str = str(video_path)
+    if _FFMPEG_OPTS:
+        cap = cv2.VideoCapture(path_str, cv2.CAP_FFMPEG)
+    else:
+        cap = cv2.VideoCapture(path_str)
+
+    if path_str.startswith(_STREAM_PREFIXES) or path_str.isdigit():
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    return cap
+
+def get_video_info(video_path: Union[str, Path], cap: Optional[cv2.VideoCapture] = None) -> Dict:
     """
     Get basic information about a video file.
-    
+
     Args:
         video_path: Path to the video file
-        
+        cap: Optional already-open capture to query; it is left open so
+            the caller can keep decoding from it
+
     Returns:
         Dictionary containing video information
     """
-    cap = cv2.VideoCapture(str(video_path))
+    own_cap = cap is None
+    if own_cap:
+        cap = open_video_capture(video_path)
     if not cap.isOpened():
         raise ValueError(f"Could not open video file: {video_path}")
-    
+
     # Get video properties
     width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
     height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
     fps = cap.get(cv2.CAP_PROP_FPS)
     frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
     duration = frame_count / fps if fps > 0 else 0
-    
-    # Release the video capture
-    cap.release()
-    
+
+    # Release the video capture only if we opened it ourselves
+    if own_cap:
+        cap.release()
+
     return {
         "width": width,
         "height": height,
@@ -0,0 +1,68 @@
+"""
+Bounded store for frame extraction task status.
+
+Task entries were previously kept in a plain module-level dict that grew
+for the lifetime of the process. This store caps memory with a TTL cache
+(finished tasks expire after a day) and guards mutation with an asyncio
+lock so the router and background tasks can update entries safely.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional
+
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Bounded cache of task_id -> task info; entries expire 24h after last write
+_tasks: TTLCache = TTLCache(maxsize=10_000, ttl=24 * 60 * 60)
+_lock = asyncio.Lock()
+
+
+async def get(task_id: str) -> Optional[Dict]:
+    """
+    Get task info by ID.
+
+    Args:
+        task_id: ID of the task
+
+    Returns:
+        Task info dictionary, or None if the task is unknown or expired
+    """
+    async with _lock:
+        return _tasks.get(task_id)
+
+
+async def put(task_id: str, info: Dict) -> None:
+    """
+    Store task info under the given ID.
+
+    Args:
+        task_id: ID of the task
+        info: Task info dictionary
+    """
+    async with _lock:
+        _tasks[task_id] = info
+
+
+async def update(task_id: str, **fields) -> Optional[Dict]:
+    """
+    Update fields of an existing task.
+
+    Args:
+        task_id: ID of the task
+        **fields: Fields to merge into the task info
+
+    Returns:
+        The updated task info, or None if the task is unknown or expired
+    """
+    async with _lock:
+        info = _tasks.get(task_id)
+        if info is None:
+            logger.warning("Task %s not found in task store", task_id)
+            return None
+        info.update(fields)
+        # Re-assign to refresh the TTL on every update
+        _tasks[task_id] = info
+        return info
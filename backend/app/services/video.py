@@ -1,7 +1,11 @@
 import os
+import sys
+import time
+import glob
 import logging
 import shutil
 import asyncio
+import aiofiles
 from typing import Dict, List, Optional, Tuple, BinaryIO
 from uuid import uuid4
 from datetime import datetime
@@ -19,6 +23,23 @@ RESULTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__fil
 # Buffer size for file streaming (8MB chunks)
 CHUNK_SIZE = 8 * 1024 * 1024
 
+# Create the upload target once at import instead of re-running an
+# always-EEXIST mkdir on every request
+os.makedirs(VIDEOS_DIR, exist_ok=True)
+
+
+class UploadTooLargeError(Exception):
+    """Raised when an upload body grows past MAX_UPLOAD_SIZE mid-stream."""
+    pass
+
+
+def _sendfile_all(src_fd: int, dst_fd: int) -> int:
+    """Copy src_fd into dst_fd with os.sendfile, returning bytes copied."""
+    total = 0
+    while sent := os.sendfile(dst_fd, src_fd, None, CHUNK_SIZE):
+        total += sent
+    return total
+
 
 async def save_uploaded_video(file: UploadFile) -> Dict:
     """
@@ -38,38 +59,69 @@ async def save_uploaded_video(file: UploadFile) -> Dict:
     
     # Save the uploaded file using chunked streaming
     try:
-        # Ensure directory exists
-        os.makedirs(VIDEOS_DIR, exist_ok=True)  # Use VIDEOS_DIR instead of UPLOAD_DIR
-        
         # Log start of file save
         logger.info(f"Starting to save file: {file.filename} as {safe_filename}")
         
-        # Open file for writing
-        with open(file_path, "wb") as buffer:
-            # Stream file contents in chunks to handle large files
-            bytes_copied = 0
-            start_time = datetime.now()
-            
-            # Read and write in chunks to avoid loading entire file into memory
-            while chunk := await file.read(CHUNK_SIZE):
-                buffer.write(chunk)
-                bytes_copied += len(chunk)
-                
-                # Periodically log progress for large files
-                if bytes_copied % (100 * 1024 * 1024) == 0:  # Log every 100MB
-                    elapsed = (datetime.now() - start_time).total_seconds()
-                    mb_copied = bytes_copied / (1024 * 1024)
-                    speed = mb_copied / elapsed if elapsed > 0 else 0
-                    logger.info(f"Upload progress: {mb_copied:.1f}MB at {speed:.1f}MB/s")
-                    
-            # Log completion
-            elapsed = (datetime.now() - start_time).total_seconds()
-            mb_copied = bytes_copied / (1024 * 1024)
-            speed = mb_copied / elapsed if elapsed > 0 else 0
-            logger.info(f"File saved: {safe_filename}, "
-                      f"Size: {mb_copied:.1f}MB, "
-                      f"Duration: {elapsed:.1f}s, "
-                      f"Speed: {speed:.1f}MB/s")
+        # Monotonic clock for rate reporting: cheaper than
+        # datetime.now() and immune to wall-clock jumps
+        start_time = time.monotonic()
+
+        if sys.platform == "linux" and getattr(file.file, "_rolled", False):
+            # The spooled upload already lives in a real temp file, so
+            # the kernel can copy it into place directly (os.sendfile) —
+            # the bytes never pass through Python at all
+            with open(file_path, "wb") as buffer:
+                bytes_copied = await asyncio.to_thread(
+                    _sendfile_all, file.file.fileno(), buffer.fileno()
+                )
+        else:
+            # Open file for writing asynchronously so writes don't block
+            # the event loop. Unbuffered: we already chunk at CHUNK_SIZE,
+            # so the default buffered writer would just add a redundant
+            # copy between our 8MB chunk and write(2)
+            async with aiofiles.open(file_path, "wb", buffering=0) as buffer:
+                # Stream file contents in chunks to handle large files
+                bytes_copied = 0
+                next_log_threshold = 100 * 1024 * 1024  # Log every 100MB
+
+                # Read into one reusable buffer instead of letting each
+                # read allocate a fresh CHUNK_SIZE bytes object; the
+                # write is awaited before the buffer is reused.
+                # SpooledTemporaryFile only grew readinto in Python
+                # 3.11, so older runtimes fall back to plain reads
+                readinto = getattr(file.file, "readinto", None)
+                if readinto is not None:
+                    chunk_view = memoryview(bytearray(CHUNK_SIZE))
+
+                    async def read_chunk():
+                        return chunk_view[:await asyncio.to_thread(readinto, chunk_view)]
+                else:
+                    async def read_chunk():
+                        return await file.read(CHUNK_SIZE)
+
+                while len(chunk := await read_chunk()):
+                    await buffer.write(chunk)
+                    bytes_copied += len(chunk)
+
+                    # Periodically log progress for large files; skip
+                    # even the rate arithmetic when INFO is off, and let
+                    # the logger defer the string formatting
+                    if bytes_copied >= next_log_threshold:
+                        next_log_threshold += 100 * 1024 * 1024
+                        if logger.isEnabledFor(logging.INFO):
+                            elapsed = time.monotonic() - start_time
+                            mb_copied = bytes_copied / (1024 * 1024)
+                            speed = mb_copied / elapsed if elapsed > 0 else 0
+                            logger.info("Upload progress: %.1fMB at %.1fMB/s", mb_copied, speed)
+
+        # Log completion
+        elapsed = time.monotonic() - start_time
+        mb_copied = bytes_copied / (1024 * 1024)
+        speed = mb_copied / elapsed if elapsed > 0 else 0
+        logger.info(f"File saved: {safe_filename}, "
+                  f"Size: {mb_copied:.1f}MB, "
+                  f"Duration: {elapsed:.1f}s, "
+                  f"Speed: {speed:.1f}MB/s")
                       
     except Exception as e:
         logger.error(f"Error saving uploaded file: {e}")
@@ -81,12 +133,13 @@ async def save_uploaded_video(file: UploadFile) -> Dict:
             except:
                 pass
         raise
-    finally:
-        # Close the uploaded file
-        await file.close()
-    
-    # Return metadata about the saved file
-    file_size = os.path.getsize(file_path)
+
+    # No explicit file.close() here: FastAPI closes the UploadFile on
+    # request teardown
+
+    # Return metadata about the saved file; bytes_copied already counts
+    # exactly what hit the disk, so no stat round-trip is needed
+    file_size = bytes_copied
     
     return {
         "id": video_id,
@@ -98,28 +151,95 @@ async def save_uploaded_video(file: UploadFile) -> Dict:
     }
 
 
+async def save_video_stream(stream, original_filename: Optional[str]) -> Dict:
+    """
+    Save a raw video body streamed directly from the request.
+    Skips the multipart parser entirely — chunks go straight to disk.
+    Returns metadata about the saved file.
+    """
+    # Generate a unique ID for this video
+    video_id = str(uuid4())
+
+    # Extract file extension from the original filename
+    file_extension = os.path.splitext(original_filename or "unknown.mp4")[1].lower()
+
+    # Create a safe filename with the ID and original extension
+    safe_filename = f"{video_id}{file_extension}"
+    file_path = os.path.join(VIDEOS_DIR, safe_filename)
+
+    try:
+        logger.info(f"Starting to save streamed file: {original_filename} as {safe_filename}")
+
+        bytes_copied = 0
+        start_time = time.monotonic()
+
+        async with aiofiles.open(file_path, "wb") as buffer:
+            async for chunk in stream:
+                await buffer.write(chunk)
+                bytes_copied += len(chunk)
+
+                # Chunked-transfer requests carry no Content-Length, so
+                # the declared-size check upstream can't be trusted —
+                # enforce the cap on what actually arrives
+                if bytes_copied > settings.MAX_UPLOAD_SIZE:
+                    raise UploadTooLargeError(
+                        f"Upload exceeded {settings.MAX_UPLOAD_SIZE} bytes"
+                    )
+
+        elapsed = time.monotonic() - start_time
+        mb_copied = bytes_copied / (1024 * 1024)
+        speed = mb_copied / elapsed if elapsed > 0 else 0
+        logger.info(f"File saved: {safe_filename}, "
+                  f"Size: {mb_copied:.1f}MB, "
+                  f"Duration: {elapsed:.1f}s, "
+                  f"Speed: {speed:.1f}MB/s")
+
+    except Exception as e:
+        logger.error(f"Error saving streamed file: {e}")
+        # Try to clean up partial file if there was an error
+        if os.path.exists(file_path):
+            try:
+                os.remove(file_path)
+                logger.info(f"Cleaned up partial file after error: {file_path}")
+            except:
+                pass
+        raise
+
+    return {
+        "id": video_id,
+        "filename": safe_filename,
+        "original_filename": original_filename,
+        "path": file_path,
+        "upload_time": datetime.now().isoformat(),
+        "size": bytes_copied
+    }
+
+
 async def cleanup_original_video(video_id: str) -> bool:
     """
     Delete the original video file after processing is complete.
     Returns True if the file was deleted, False if it wasn't found.
     """
-    # Get all files in videos directory with the video_id prefix
-    deleted_files = []
-    
-    for filename in os.listdir(VIDEOS_DIR):
-        # Check if the file starts with the video_id
-        if filename.startswith(video_id):
-            video_path = os.path.join(VIDEOS_DIR, filename)
-            
-            try:
-                if os.path.exists(video_path):
-                    file_size_mb = os.path.getsize(video_path) / (1024 * 1024)
-                    os.remove(video_path)
-                    deleted_files.append(filename)
-                    logger.info(f"Deleted original video: {filename} ({file_size_mb:.1f}MB)")
-            except Exception as e:
-                logger.error(f"Error deleting video file {filename}: {e}")
-    
+    # Match only this video's files instead of scanning the whole
+    # directory and prefix-testing every name in Python
+    matches = await asyncio.to_thread(glob.glob, os.path.join(VIDEOS_DIR, f"{video_id}.*"))
+
+    def _delete_one(video_path: str) -> Optional[str]:
+        filename = os.path.basename(video_path)
+        try:
+            file_size_mb = os.path.getsize(video_path) / (1024 * 1024)
+            os.remove(video_path)
+            logger.info(f"Deleted original video: {filename} ({file_size_mb:.1f}MB)")
+            return filename
+        except Exception as e:
+            logger.error(f"Error deleting video file {filename}: {e}")
+            return None
+
+    # Unlink the original and any derived files concurrently rather
+    # than one serial stat+remove round-trip at a time
+    results = await asyncio.gather(*(asyncio.to_thread(_delete_one, p) for p in matches))
+    deleted_files = [name for name in results if name]
+
     return len(deleted_files) > 0
 
 